@@ -3,7 +3,6 @@
     Handles storage and retrieval of the plugin QgsSettings.
 """
 
-import contextlib
 import dataclasses
 import datetime
 import enum
@@ -16,24 +15,87 @@ from qgis.PyQt import (
 )
 from qgis.core import QgsRectangle, QgsSettings
 
+_shared_settings = None
 
-@contextlib.contextmanager
-def qgis_settings(group_root: str, settings=None):
+
+def _get_shared_settings() -> QgsSettings:
+    """Returns the plugin wide QgsSettings instance, creating it on first use.
+
+    The instance may carry an open group from an enclosing qgis_settings
+    block, use qgis_settings instead of reading absolute keys from it.
+
+    :returns: Shared QGIS settings instance.
+    :rtype: QgsSettings
+    """
+    global _shared_settings
+    if _shared_settings is None:
+        _shared_settings = QgsSettings()
+    return _shared_settings
+
+
+def _default_settings() -> QgsSettings:
+    """Returns the settings instance to use when none was given.
+
+    The shared instance is only reused from the main thread and while
+    it has no open group, so that a group root is always resolved from
+    the settings root. Otherwise a new QgsSettings is created.
+
+    :returns: QGIS settings instance with an empty group stack.
+    :rtype: QgsSettings
+    """
+    app = QtCore.QCoreApplication.instance()
+    if app is not None and QtCore.QThread.currentThread() != app.thread():
+        return QgsSettings()
+    shared = _get_shared_settings()
+    if shared.group():
+        return QgsSettings()
+    return shared
+
+
+class qgis_settings:
     """Context manager to help defining groups when creating QgsSettings.
 
+    Implemented as a plain class rather than through
+    contextlib.contextmanager to avoid creating a generator for every
+    settings group access.
+
+    When no settings are passed the group root is always resolved from
+    the settings root, nested contexts included.
+
     :param group_root: Name of the root group for the settings.
     :type group_root: str
 
-    :param settings: QGIS settings to use
+    :param settings: QGIS settings to use, defaults to the shared
+     plugin settings instance when it has no open group.
     :type settings: QgsSettings
 
-    :yields: Instance of the created settings.
-    :type: QgsSettings
+    :returns: Instance of the settings with the group started, bound by
+     the with statement.
+    :rtype: QgsSettings
     """
-    if settings is None:
-        settings = QgsSettings()
-    settings.beginGroup(group_root)
-    try:
-        yield settings
-    finally:
-        settings.endGroup()
+
+    __slots__ = ("group_root", "settings", "_active_settings")
+
+    def __init__(self, group_root: str, settings=None):
+        self.group_root = group_root
+        self.settings = settings
+        self._active_settings = None
+
+    def __enter__(self) -> QgsSettings:
+        """Begins the settings group.
+
+        :returns: Instance of the settings with the group started.
+        :rtype: QgsSettings
+        """
+        settings = self.settings
+        if settings is None:
+            settings = _default_settings()
+        settings.beginGroup(self.group_root)
+        self._active_settings = settings
+        return settings
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ends the settings group, also when an exception was raised."""
+        self._active_settings.endGroup()
+        self._active_settings = None
+        return False
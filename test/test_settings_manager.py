@@ -7,6 +7,98 @@ import unittest
 
 import uuid
 
+from qgis.PyQt import QtCore
+from qgis.core import QgsSettings
+
+from utilities_for_testing import get_qgis_app
+
+from conf import _get_shared_settings, qgis_settings
+
+QGIS_APP = get_qgis_app()
+
 
 class SettingsManagerTest(unittest.TestCase):
     """Test the plugins setting manager"""
+
+    def setUp(self):
+        self.root = f"qgis-templates-symbology-test/{uuid.uuid4()}"
+
+    def tearDown(self):
+        QgsSettings().remove(self.root)
+
+    def test_nested_settings_groups_are_absolute(self):
+        """Nested qgis_settings groups resolve from the settings root"""
+        with qgis_settings(self.root):
+            self.assertEqual(_get_shared_settings().group(), self.root)
+            with qgis_settings(f"{self.root}/child") as settings:
+                settings.setValue("name", "child_value")
+                self.assertEqual(settings.value("name"), "child_value")
+            self.assertEqual(_get_shared_settings().group(), self.root)
+        self.assertEqual(_get_shared_settings().group(), "")
+
+        self.assertEqual(
+            QgsSettings().value(f"{self.root}/child/name"),
+            "child_value"
+        )
+        self.assertIsNone(
+            QgsSettings().value(f"{self.root}/{self.root}/child/name")
+        )
+
+    def test_settings_resolved_when_entered(self):
+        """Contexts built before being entered still use absolute groups"""
+        parent = qgis_settings(self.root)
+        child = qgis_settings(f"{self.root}/child")
+        with parent:
+            with child as settings:
+                settings.setValue("name", "child_value")
+        self.assertEqual(_get_shared_settings().group(), "")
+
+        self.assertEqual(
+            QgsSettings().value(f"{self.root}/child/name"),
+            "child_value"
+        )
+        self.assertIsNone(
+            QgsSettings().value(f"{self.root}/{self.root}/child/name")
+        )
+
+    def test_worker_thread_does_not_use_shared_settings(self):
+        """qgis_settings entered from a worker thread gets its own settings"""
+        shared_settings = _get_shared_settings()
+        context = qgis_settings(self.root)
+        used_settings = []
+
+        class Worker(QtCore.QThread):
+            def run(self):
+                with context as settings:
+                    used_settings.append(settings)
+
+        worker = Worker()
+        worker.start()
+        worker.wait()
+
+        self.assertEqual(len(used_settings), 1)
+        self.assertIsNot(used_settings[0], shared_settings)
+        self.assertEqual(shared_settings.group(), "")
+
+    def test_shared_settings_group_restored_on_error(self):
+        """The shared settings group is ended when the body raises"""
+        with self.assertRaises(ValueError):
+            with qgis_settings(self.root):
+                with qgis_settings(f"{self.root}/child"):
+                    raise ValueError("test error")
+        self.assertEqual(_get_shared_settings().group(), "")
+
+    def test_passed_settings_group_ended_on_error(self):
+        """qgis_settings ends the group of passed settings when the body
+        raises"""
+        own_settings = QgsSettings()
+        with self.assertRaises(ValueError):
+            with qgis_settings(self.root, own_settings) as settings:
+                self.assertIs(settings, own_settings)
+                raise ValueError("test error")
+        self.assertEqual(own_settings.group(), "")
+        self.assertEqual(_get_shared_settings().group(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()